@@ -7,14 +7,15 @@ This module initializes the FastAPI app and configures middleware.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 import os
 
 # Create FastAPI app
 app = FastAPI(
     title="NPS IntelliPlan API",
     description="AI-Driven Retirement Corpus & Pension Forecasting Engine",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS for local development
@@ -5,7 +5,11 @@ Comprehensive REST API with forecast, comparison, optimization,
 tax benefits, sensitivity analysis, Gemini AI advice, and more.
 """
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import orjson
+from functools import lru_cache
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict
 from backend.engine.corpus_calculator import (
@@ -13,7 +17,8 @@ from backend.engine.corpus_calculator import (
     compare_scenarios,
     calculate_tax_benefits,
     calculate_sensitivity,
-    calculate_inflation_erosion
+    calculate_inflation_erosion,
+    calculate_projection_batch
 )
 from backend.engine.monte_carlo import (
     MonteCarloSimulator,
@@ -21,8 +26,7 @@ from backend.engine.monte_carlo import (
 )
 from backend.engine.optimizer import ContributionOptimizer
 from backend.engine.gemini_ai import (
-    generate_retirement_advice,
-    generate_scenario_narrative,
+    generate_full_insights_async,
     generate_risk_assessment,
     generate_goal_gap_analysis,
     generate_what_if_analysis,
@@ -41,6 +45,8 @@ from backend.engine.nps_config import (
 
 router = APIRouter()
 
+MAX_FORECAST_BATCH = 100
+
 
 # ── Request Models ───────────────────────────────────────────
 
@@ -130,13 +136,46 @@ class WhatIfRequest(BaseModel):
     employer_contribution: float = Field(default=0, ge=0)
 
 
+# ── Static Responses ─────────────────────────────────────────
+# Constant payloads are serialized once at import and served with
+# cache headers so browsers can skip repeat requests.
+
+STATIC_CACHE_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+_ASSUMPTIONS_BODY = orjson.dumps({
+    "return_assumptions": EXPECTED_RETURNS,
+    "asset_allocation": ASSET_ALLOCATION,
+    "annuity_providers": ANNUITY_PROVIDERS,
+    "inflation": {
+        "default_rate": DEFAULT_INFLATION_RATE,
+        "std_deviation": 1.5
+    },
+    "nps_regulations": {
+        "mandatory_annuity_pct": 40,
+        "max_lumpsum_pct": 60,
+        "min_monthly_contribution": NPS_MIN_CONTRIBUTION_MONTHLY,
+        "partial_withdrawal_purposes": PARTIAL_WITHDRAWAL_PURPOSES
+    },
+    "simulation": {"iterations": 10000},
+    "tax_benefits": {
+        "sec_80ccd1_limit": 150000,
+        "sec_80ccd1b_exclusive": 50000,
+        "sec_80ccd2_employer": "10% of basic salary"
+    },
+    "disclaimer": "Projections are based on historical data and assumptions. Actual results may vary. This is a decision-support tool, not financial advice."
+})
+
+_ANNUITY_PROVIDERS_BODY = orjson.dumps(ANNUITY_PROVIDERS)
+
+
 # ── Endpoints ────────────────────────────────────────────────
 
 @router.post("/forecast")
 async def forecast(req: ForecastRequest):
     """Run retirement forecast with optional Monte Carlo simulation."""
     try:
-        det = calculate_retirement_projection(
+        det = await run_in_threadpool(
+            calculate_retirement_projection,
             current_age=req.current_age,
             retirement_age=req.retirement_age,
             monthly_contribution=req.monthly_contribution,
@@ -154,18 +193,6 @@ async def forecast(req: ForecastRequest):
             "asset_allocation": ASSET_ALLOCATION.get(req.risk_profile, {})
         }
 
-        if req.use_monte_carlo:
-            sim = MonteCarloSimulator()
-            mc = sim.simulate_retirement_corpus(
-                current_age=req.current_age,
-                retirement_age=req.retirement_age,
-                monthly_contribution=req.monthly_contribution,
-                risk_profile=req.risk_profile,
-                initial_balance=req.initial_balance
-            )
-            result["method"] = "monte_carlo"
-            result["simulation_results"] = mc
-
         # Generate AI advice
         advice_data = {
             "current_age": req.current_age,
@@ -179,8 +206,29 @@ async def forecast(req: ForecastRequest):
             "total_contributions": det["total_contributions"],
             "employer_contribution": req.employer_contribution
         }
-        result["ai_advice"] = generate_retirement_advice(advice_data)
-        result["narrative"] = generate_scenario_narrative(det)
+
+        # Gemini calls and the Monte Carlo run are independent; overlap them.
+        # The Gemini calls are awaited natively rather than holding threads
+        tasks = [generate_full_insights_async(advice_data, det)]
+        if req.use_monte_carlo:
+            sim = MonteCarloSimulator()
+            tasks.append(run_in_threadpool(
+                sim.simulate_retirement_corpus,
+                current_age=req.current_age,
+                retirement_age=req.retirement_age,
+                monthly_contribution=req.monthly_contribution,
+                risk_profile=req.risk_profile,
+                initial_balance=req.initial_balance
+            ))
+
+        (advice, narrative), *mc = await asyncio.gather(*tasks)
+
+        if mc:
+            result["method"] = "monte_carlo"
+            result["simulation_results"] = mc[0]
+
+        result["ai_advice"] = advice
+        result["narrative"] = narrative
 
         return result
 
@@ -188,19 +236,49 @@ async def forecast(req: ForecastRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/forecast-batch")
+async def forecast_batch(reqs: List[ForecastRequest]):
+    """Deterministic headline forecasts for several inputs in one call."""
+    if len(reqs) > MAX_FORECAST_BATCH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_FORECAST_BATCH} forecasts per batch"
+        )
+    try:
+        scenarios = [
+            {
+                "current_age": req.current_age,
+                "retirement_age": req.retirement_age,
+                "monthly_contribution": req.monthly_contribution,
+                "risk_profile": req.risk_profile,
+                "inflation_rate": req.inflation_rate,
+                "initial_balance": req.initial_balance,
+                "annual_step_up": req.annual_step_up,
+                "employer_contribution": req.employer_contribution,
+                "annuity_provider": req.annuity_provider
+            }
+            for req in reqs
+        ]
+        return await run_in_threadpool(calculate_projection_batch, scenarios)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.post("/compare")
 async def compare(req: ComparisonRequest):
     """Compare all risk profiles side by side."""
     try:
         if req.use_monte_carlo:
-            scenarios = run_scenario_comparison(
+            scenarios = await run_in_threadpool(
+                run_scenario_comparison,
                 current_age=req.current_age,
                 retirement_age=req.retirement_age,
                 monthly_contribution=req.monthly_contribution,
                 initial_balance=req.initial_balance
             )
         else:
-            scenarios = compare_scenarios(
+            scenarios = await run_in_threadpool(
+                compare_scenarios,
                 current_age=req.current_age,
                 retirement_age=req.retirement_age,
                 monthly_contribution=req.monthly_contribution,
@@ -223,7 +301,8 @@ async def optimize(req: OptimizationRequest):
     """Find required contribution for target pension."""
     try:
         optimizer = ContributionOptimizer()
-        return optimizer.find_required_contribution(
+        return await run_in_threadpool(
+            optimizer.find_required_contribution,
             current_age=req.current_age,
             retirement_age=req.retirement_age,
             target_monthly_pension=req.target_monthly_pension,
@@ -253,7 +332,8 @@ async def tax_benefits(req: TaxRequest):
 async def sensitivity(req: WhatIfRequest):
     """Sensitivity analysis — impact of changing each variable."""
     try:
-        return calculate_sensitivity(
+        return await run_in_threadpool(
+            calculate_sensitivity,
             current_age=req.current_age,
             retirement_age=req.retirement_age,
             monthly_contribution=req.monthly_contribution,
@@ -269,7 +349,7 @@ async def sensitivity(req: WhatIfRequest):
 async def risk_assessment(req: RiskAssessmentRequest):
     """AI-powered risk profile assessment."""
     try:
-        return generate_risk_assessment(req.model_dump())
+        return await run_in_threadpool(generate_risk_assessment, req.model_dump())
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -278,7 +358,8 @@ async def risk_assessment(req: RiskAssessmentRequest):
 async def goal_gap(req: GoalGapRequest):
     """Analyze gap between current plan and target pension."""
     try:
-        projection = calculate_retirement_projection(
+        projection = await run_in_threadpool(
+            calculate_retirement_projection,
             current_age=req.current_age,
             retirement_age=req.retirement_age,
             monthly_contribution=req.monthly_contribution,
@@ -286,7 +367,8 @@ async def goal_gap(req: GoalGapRequest):
             inflation_rate=req.inflation_rate,
             initial_balance=req.initial_balance,
             annual_step_up=req.annual_step_up,
-            employer_contribution=req.employer_contribution
+            employer_contribution=req.employer_contribution,
+            include_yearly_breakdown=False
         )
         return generate_goal_gap_analysis(projection, req.target_monthly_pension)
     except Exception as e:
@@ -297,7 +379,8 @@ async def goal_gap(req: GoalGapRequest):
 async def what_if(req: WhatIfRequest):
     """What-if scenario analysis."""
     try:
-        base = calculate_retirement_projection(
+        base = await run_in_threadpool(
+            calculate_retirement_projection,
             current_age=req.current_age,
             retirement_age=req.retirement_age,
             monthly_contribution=req.monthly_contribution,
@@ -305,9 +388,11 @@ async def what_if(req: WhatIfRequest):
             inflation_rate=req.inflation_rate,
             initial_balance=req.initial_balance,
             annual_step_up=req.annual_step_up,
-            employer_contribution=req.employer_contribution
+            employer_contribution=req.employer_contribution,
+            include_yearly_breakdown=False
         )
-        scenarios = generate_what_if_analysis(
+        scenarios = await run_in_threadpool(
+            generate_what_if_analysis,
             base, req.current_age, req.retirement_age,
             req.monthly_contribution, req.risk_profile,
             req.inflation_rate, req.initial_balance,
@@ -328,11 +413,21 @@ async def what_if(req: WhatIfRequest):
 async def peer_comparison(req: ForecastRequest):
     """AI-powered comparison with peer cohorts."""
     try:
-        return generate_peer_comparison(req.model_dump())
+        peer_data = {
+            "current_age": req.current_age,
+            "monthly_contribution": req.monthly_contribution
+        }
+        return await run_in_threadpool(generate_peer_comparison, peer_data)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@lru_cache(maxsize=1024)
+def _inflation_erosion_body(amount: float, inflation_rate: float, years: int) -> bytes:
+    """Serialized inflation erosion timeline, memoized per query."""
+    return orjson.dumps(calculate_inflation_erosion(amount, inflation_rate, years))
+
+
 @router.get("/inflation-erosion")
 async def inflation_erosion(
     amount: float = 100000,
@@ -341,7 +436,11 @@ async def inflation_erosion(
 ):
     """Show how inflation erodes purchasing power."""
     try:
-        return calculate_inflation_erosion(amount, inflation_rate, years)
+        return Response(
+            content=_inflation_erosion_body(amount, inflation_rate, years),
+            media_type="application/json",
+            headers=STATIC_CACHE_HEADERS
+        )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -349,31 +448,18 @@ async def inflation_erosion(
 @router.get("/assumptions")
 async def assumptions():
     """All modeling assumptions for transparency."""
-    return {
-        "return_assumptions": EXPECTED_RETURNS,
-        "asset_allocation": ASSET_ALLOCATION,
-        "annuity_providers": ANNUITY_PROVIDERS,
-        "inflation": {
-            "default_rate": DEFAULT_INFLATION_RATE,
-            "std_deviation": 1.5
-        },
-        "nps_regulations": {
-            "mandatory_annuity_pct": 40,
-            "max_lumpsum_pct": 60,
-            "min_monthly_contribution": NPS_MIN_CONTRIBUTION_MONTHLY,
-            "partial_withdrawal_purposes": PARTIAL_WITHDRAWAL_PURPOSES
-        },
-        "simulation": {"iterations": 10000},
-        "tax_benefits": {
-            "sec_80ccd1_limit": 150000,
-            "sec_80ccd1b_exclusive": 50000,
-            "sec_80ccd2_employer": "10% of basic salary"
-        },
-        "disclaimer": "Projections are based on historical data and assumptions. Actual results may vary. This is a decision-support tool, not financial advice."
-    }
+    return Response(
+        content=_ASSUMPTIONS_BODY,
+        media_type="application/json",
+        headers=STATIC_CACHE_HEADERS
+    )
 
 
 @router.get("/annuity-providers")
 async def annuity_providers():
     """List all annuity providers and their rates."""
-    return ANNUITY_PROVIDERS
+    return Response(
+        content=_ANNUITY_PROVIDERS_BODY,
+        media_type="application/json",
+        headers=STATIC_CACHE_HEADERS
+    )
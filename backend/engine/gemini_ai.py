@@ -7,11 +7,34 @@ risk assessment, and personalized recommendations using Google Gemini.
 
 import os
 import json
-from typing import Dict, Optional
+import asyncio
+import time
+import hashlib
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from backend.engine.corpus_calculator import calculate_projection_batch
 
+try:
+    from google.api_core.exceptions import ResourceExhausted
+    _RETRYABLE_ERRORS = (ResourceExhausted,)
+except ImportError:
+    _RETRYABLE_ERRORS = ()
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
 def get_gemini_client():
-    """Get Gemini API client. Returns None if API key not set."""
+    """
+    Get Gemini API client. Returns None if API key not set.
+
+    The client is built once per process and reused; an unset key is
+    likewise remembered until restart.
+    """
     api_key = os.environ.get("GEMINI_API_KEY", "")
     if not api_key:
         return None
@@ -27,18 +50,130 @@ def get_gemini_client():
         return None
 
 
-def generate_retirement_advice(forecast_data: Dict) -> str:
+# ── Response cache ───────────────────────────────────────────
+# Prompts are built deterministically from the forecast inputs, so repeat
+# scenarios produce identical prompts. Keep recent responses in memory.
+
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_TTL = 7 * 24 * 3600  # seconds
+
+_response_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _cache_lookup(prompt: str):
+    """Return (key, cached text or None) for a prompt."""
+    key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    now = time.monotonic()
+
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is not None and now - cached[0] < RESPONSE_CACHE_TTL:
+            _response_cache.move_to_end(key)
+            return key, cached[1]
+
+    return key, None
+
+
+def _cache_store(key: str, text: str) -> None:
+    """Remember a response, evicting the least recently used beyond capacity."""
+    with _response_cache_lock:
+        _response_cache[key] = (time.monotonic(), text)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+# ── Rate-limit retries ───────────────────────────────────────
+# A 429 (ResourceExhausted) usually clears within a second, so retry it with
+# exponential backoff before callers fall back to rule-based output.
+
+GEMINI_MAX_ATTEMPTS = 3
+GEMINI_BACKOFF_BASE = 0.3  # seconds
+GEMINI_BACKOFF_MAX = 2.0  # seconds
+
+
+def _retry_delay(attempt: int) -> float:
+    """Backoff before retry number attempt + 1, logging the retry."""
+    delay = min(GEMINI_BACKOFF_BASE * 2 ** attempt, GEMINI_BACKOFF_MAX)
+    logger.warning(
+        "Gemini rate limited; retry %d/%d in %.1fs",
+        attempt + 1, GEMINI_MAX_ATTEMPTS - 1, delay
+    )
+    return delay
+
+
+def _generate_with_retry(model, prompt: str, generation_config: Optional[Dict] = None):
+    """Call model.generate_content, retrying rate-limit errors."""
+    for attempt in range(GEMINI_MAX_ATTEMPTS):
+        try:
+            return model.generate_content(prompt, generation_config=generation_config)
+        except _RETRYABLE_ERRORS:
+            if attempt == GEMINI_MAX_ATTEMPTS - 1:
+                raise
+            time.sleep(_retry_delay(attempt))
+
+
+async def _generate_with_retry_async(
+    model, prompt: str, generation_config: Optional[Dict] = None
+):
+    """Async variant of _generate_with_retry."""
+    for attempt in range(GEMINI_MAX_ATTEMPTS):
+        try:
+            return await model.generate_content_async(
+                prompt, generation_config=generation_config
+            )
+        except _RETRYABLE_ERRORS:
+            if attempt == GEMINI_MAX_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(_retry_delay(attempt))
+
+
+def generate_cached_text(
+    model, prompt: str, generation_config: Optional[Dict] = None, parse=None
+):
     """
-    Generate personalized retirement advice using Gemini.
-    Falls back to rule-based advice if API unavailable.
+    Return Gemini's response text for a prompt, reusing recent answers.
+
+    With parse, the parsed text is returned instead, and a response is only
+    cached once it parses, so a malformed reply is retried next time.
     """
-    model = get_gemini_client()
-    
-    if model is None:
-        return generate_rule_based_advice(forecast_data)
-    
-    try:
-        prompt = f"""You are an expert Indian financial advisor specializing in NPS (National Pension System).
+    key, text = _cache_lookup(prompt)
+    if text is not None:
+        return parse(text) if parse else text
+
+    text = _generate_with_retry(model, prompt, generation_config).text.strip()
+    result = parse(text) if parse else text
+    _cache_store(key, text)
+    return result
+
+
+async def generate_cached_text_async(
+    model, prompt: str, generation_config: Optional[Dict] = None, parse=None
+):
+    """Async variant of generate_cached_text; awaits Gemini without blocking the loop."""
+    key, text = _cache_lookup(prompt)
+    if text is not None:
+        return parse(text) if parse else text
+
+    response = await _generate_with_retry_async(model, prompt, generation_config)
+    text = response.text.strip()
+    result = parse(text) if parse else text
+    _cache_store(key, text)
+    return result
+
+
+# Ask Gemini for a bare JSON array of advice strings rather than parsing
+# it out of free text
+ADVICE_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": list[str]
+}
+
+
+def _advice_prompt(forecast_data: Dict) -> str:
+    """Build the retirement advice prompt for a forecast."""
+    return f"""You are an expert Indian financial advisor specializing in NPS (National Pension System).
 Based on the following retirement forecast data, provide concise, actionable advice in 4-5 bullet points.
 Be specific with numbers and mention relevant NPS regulations.
 
@@ -62,32 +197,45 @@ Provide advice that is:
 
 Format as a JSON array of strings, each being one advice point."""
 
-        response = model.generate_content(prompt)
-        text = response.text.strip()
-        
-        # Parse JSON from response
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-        
-        advice_list = json.loads(text)
-        return advice_list
+
+def generate_retirement_advice(forecast_data: Dict) -> str:
+    """
+    Generate personalized retirement advice using Gemini.
+    Falls back to rule-based advice if API unavailable.
+    """
+    model = get_gemini_client()
+    
+    if model is None:
+        return generate_rule_based_advice(forecast_data)
+    
+    try:
+        return generate_cached_text(
+            model, _advice_prompt(forecast_data), ADVICE_GENERATION_CONFIG,
+            parse=json.loads
+        )
     except Exception as e:
         return generate_rule_based_advice(forecast_data)
 
 
-def generate_scenario_narrative(scenario_data: Dict) -> str:
-    """
-    Generate a plain-English narrative explaining a forecast scenario.
-    """
+async def generate_retirement_advice_async(forecast_data: Dict) -> str:
+    """Async variant of generate_retirement_advice."""
     model = get_gemini_client()
     
     if model is None:
-        return generate_rule_based_narrative(scenario_data)
+        return generate_rule_based_advice(forecast_data)
     
     try:
-        prompt = f"""Write a brief 3-4 sentence analysis of this NPS retirement forecast.
+        return await generate_cached_text_async(
+            model, _advice_prompt(forecast_data), ADVICE_GENERATION_CONFIG,
+            parse=json.loads
+        )
+    except Exception:
+        return generate_rule_based_advice(forecast_data)
+
+
+def _narrative_prompt(scenario_data: Dict) -> str:
+    """Build the plain-English forecast narrative prompt."""
+    return f"""Write a brief 3-4 sentence analysis of this NPS retirement forecast.
 Explain what the numbers mean in simple terms for an Indian subscriber.
 Mention if the plan is on track or needs adjustment.
 
@@ -95,12 +243,53 @@ Data: {json.dumps(scenario_data, indent=2)}
 
 Be concise and conversational. No bullet points. Return plain text only."""
 
-        response = model.generate_content(prompt)
-        return response.text.strip()
+
+def generate_scenario_narrative(scenario_data: Dict) -> str:
+    """
+    Generate a plain-English narrative explaining a forecast scenario.
+    """
+    model = get_gemini_client()
+    
+    if model is None:
+        return generate_rule_based_narrative(scenario_data)
+    
+    try:
+        return generate_cached_text(model, _narrative_prompt(scenario_data))
+    except Exception:
+        return generate_rule_based_narrative(scenario_data)
+
+
+async def generate_scenario_narrative_async(scenario_data: Dict) -> str:
+    """Async variant of generate_scenario_narrative."""
+    model = get_gemini_client()
+    
+    if model is None:
+        return generate_rule_based_narrative(scenario_data)
+    
+    try:
+        return await generate_cached_text_async(model, _narrative_prompt(scenario_data))
     except Exception:
         return generate_rule_based_narrative(scenario_data)
 
 
+async def generate_full_insights_async(forecast_data: Dict, scenario_data: Dict) -> Tuple:
+    """Fetch the forecast advice and narrative concurrently."""
+    return tuple(await asyncio.gather(
+        generate_retirement_advice_async(forecast_data),
+        generate_scenario_narrative_async(scenario_data)
+    ))
+
+
+# Risk questionnaire scoring tables; each factor contributes 0-3 points
+MAX_FACTOR_SCORE = 3
+AGE_BOUNDS = (30, 40, 50)
+AGE_SCORES = (3, 2, 1, 0)
+HORIZON_BOUNDS = (5, 10, 20)
+HORIZON_SCORES = (0, 1, 2, 3)
+TOLERANCE_SCORES = {"high": 3, "moderate": 2, "low": 1}
+STABILITY_SCORES = {"very_stable": 3, "stable": 2, "unstable": 1}
+
+
 def generate_risk_assessment(answers: Dict) -> Dict:
     """
     Generate a risk profile recommendation based on questionnaire answers.
@@ -121,33 +310,18 @@ def generate_risk_assessment(answers: Dict) -> Dict:
         "financial_goals": answers.get("financial_goals", "retirement")
     }
     
-    # Age factor
     age = risk_factors["age"]
-    if age < 30: score += 3
-    elif age < 40: score += 2
-    elif age < 50: score += 1
-    total += 3
-    
-    # Horizon factor
     horizon = risk_factors["investment_horizon"]
-    if horizon > 20: score += 3
-    elif horizon > 10: score += 2
-    elif horizon > 5: score += 1
-    total += 3
-    
-    # Risk tolerance factor
-    tolerance = risk_factors.get("risk_tolerance", "moderate")
-    if tolerance == "high": score += 3
-    elif tolerance == "moderate": score += 2
-    elif tolerance == "low": score += 1
-    total += 3
-    
-    # Income stability
-    stability = risk_factors.get("income_stability", "stable")
-    if stability == "very_stable": score += 3
-    elif stability == "stable": score += 2
-    elif stability == "unstable": score += 1
-    total += 3
+    tolerance = risk_factors["risk_tolerance"]
+    stability = risk_factors["income_stability"]
+    
+    # Younger investors (under 30 / 40 / 50) score higher
+    score += AGE_SCORES[bisect_right(AGE_BOUNDS, age)]
+    # Longer horizons (over 5 / 10 / 20 years) score higher
+    score += HORIZON_SCORES[bisect_left(HORIZON_BOUNDS, horizon)]
+    score += TOLERANCE_SCORES.get(tolerance, 0)
+    score += STABILITY_SCORES.get(stability, 0)
+    total += 4 * MAX_FACTOR_SCORE
     
     # Calculate risk score percentage
     risk_pct = (score / total) * 100
@@ -171,8 +345,7 @@ Age: {age}, Horizon: {horizon} years, Risk tolerance: {tolerance}, Income: {stab
 Recommended profile: {profile}
 
 One sentence only, specific to NPS India."""
-            response = model.generate_content(prompt)
-            ai_insight = response.text.strip()
+            ai_insight = generate_cached_text(model, prompt)
         except Exception:
             pass
     
@@ -248,73 +421,62 @@ def generate_what_if_analysis(
     """
     Generate what-if scenarios to show impact of different choices.
     """
-    from backend.engine.corpus_calculator import calculate_retirement_projection
     
-    scenarios = {}
+    base_inputs = {
+        "current_age": current_age,
+        "retirement_age": retirement_age,
+        "monthly_contribution": monthly_contribution,
+        "risk_profile": risk_profile,
+        "inflation_rate": inflation_rate,
+        "initial_balance": initial_balance,
+        "annual_step_up": annual_step_up,
+        "employer_contribution": employer_contribution
+    }
+    
+    # (key, label, inputs) for each alternative; projected together below
+    candidates = []
     
     # What if retire 2 years later?
     if retirement_age + 2 <= 75:
-        later = calculate_retirement_projection(
-            current_age, retirement_age + 2, monthly_contribution,
-            risk_profile, inflation_rate, initial_balance,
-            annual_step_up, employer_contribution
-        )
-        scenarios["retire_later"] = {
-            "label": f"Retire at {retirement_age + 2} instead of {retirement_age}",
-            "corpus": round(later["nominal_corpus"], 2),
-            "pension": round(later["monthly_pension_nominal"], 2),
-            "corpus_change_pct": round(
-                ((later["nominal_corpus"] - base_projection["nominal_corpus"]) / 
-                 base_projection["nominal_corpus"]) * 100, 1
-            )
-        }
+        candidates.append((
+            "retire_later",
+            f"Retire at {retirement_age + 2} instead of {retirement_age}",
+            {**base_inputs, "retirement_age": retirement_age + 2}
+        ))
     
     # What if contribute 50% more?
-    more = calculate_retirement_projection(
-        current_age, retirement_age, monthly_contribution * 1.5,
-        risk_profile, inflation_rate, initial_balance,
-        annual_step_up, employer_contribution
-    )
-    scenarios["contribute_more"] = {
-        "label": f"Contribute ₹{monthly_contribution * 1.5:,.0f}/month (+50%)",
-        "corpus": round(more["nominal_corpus"], 2),
-        "pension": round(more["monthly_pension_nominal"], 2),
-        "corpus_change_pct": round(
-            ((more["nominal_corpus"] - base_projection["nominal_corpus"]) / 
-             base_projection["nominal_corpus"]) * 100, 1
-        )
-    }
+    candidates.append((
+        "contribute_more",
+        f"Contribute ₹{monthly_contribution * 1.5:,.0f}/month (+50%)",
+        {**base_inputs, "monthly_contribution": monthly_contribution * 1.5}
+    ))
     
     # What if 10% annual step-up?
-    stepup = calculate_retirement_projection(
-        current_age, retirement_age, monthly_contribution,
-        risk_profile, inflation_rate, initial_balance,
-        annual_step_up=10.0
-    )
-    scenarios["with_stepup"] = {
-        "label": "10% annual step-up in contribution",
-        "corpus": round(stepup["nominal_corpus"], 2),
-        "pension": round(stepup["monthly_pension_nominal"], 2),
-        "corpus_change_pct": round(
-            ((stepup["nominal_corpus"] - base_projection["nominal_corpus"]) / 
-             base_projection["nominal_corpus"]) * 100, 1
-        )
-    }
+    candidates.append((
+        "with_stepup",
+        "10% annual step-up in contribution",
+        {**base_inputs, "annual_step_up": 10.0, "employer_contribution": 0.0}
+    ))
     
     # What if switch to aggressive?
     if risk_profile != "aggressive":
-        agg = calculate_retirement_projection(
-            current_age, retirement_age, monthly_contribution,
-            "aggressive", inflation_rate, initial_balance,
-            annual_step_up, employer_contribution
-        )
-        scenarios["go_aggressive"] = {
-            "label": "Switch to Aggressive strategy",
-            "corpus": round(agg["nominal_corpus"], 2),
-            "pension": round(agg["monthly_pension_nominal"], 2),
+        candidates.append((
+            "go_aggressive",
+            "Switch to Aggressive strategy",
+            {**base_inputs, "risk_profile": "aggressive"}
+        ))
+    
+    projections = calculate_projection_batch([inputs for _, _, inputs in candidates])
+    base_corpus = base_projection["nominal_corpus"]
+    
+    scenarios = {}
+    for (key, label, _), projection in zip(candidates, projections):
+        scenarios[key] = {
+            "label": label,
+            "corpus": projection["nominal_corpus"],
+            "pension": projection["monthly_pension_nominal"],
             "corpus_change_pct": round(
-                ((agg["nominal_corpus"] - base_projection["nominal_corpus"]) / 
-                 base_projection["nominal_corpus"]) * 100, 1
+                ((projection["nominal_corpus"] - base_corpus) / base_corpus) * 100, 1
             )
         }
     
@@ -350,8 +512,7 @@ def generate_peer_comparison(forecast_data: Dict) -> Dict:
 Age: {age}, Monthly Contribution: ₹{contrib}, Peer Average: ₹{avg_contrib}
 Provide 2-3 bullet points of AI context on where they stand and one 'Smart Move' to get ahead.
 Be encouraging but realistic. Format as plain text with bullet points."""
-            response = model.generate_content(prompt)
-            comparisons["ai_context"] = response.text.strip()
+            comparisons["ai_context"] = generate_cached_text(model, prompt)
         except Exception:
             comparisons["ai_context"] = "You are doing well compared to your cohort. Increasing by 10% could put you in the top 20% of contributors."
     else:
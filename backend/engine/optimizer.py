@@ -6,9 +6,13 @@ to achieve target retirement goals with specified probability thresholds.
 """
 
 import numpy as np
-from typing import Dict, Optional
-from backend.engine.monte_carlo import MonteCarloSimulator
-from backend.engine.corpus_calculator import calculate_retirement_projection
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from backend.engine.monte_carlo import MonteCarloSimulator, percentiles
+from backend.engine.corpus_calculator import (
+    calculate_retirement_projection,
+    estimate_monthly_pension
+)
 from backend.engine.nps_config import (
     EXPECTED_RETURNS,
     ANNUITY_RATE_SINGLE_LIFE,
@@ -16,12 +20,82 @@ from backend.engine.nps_config import (
 )
 
 
+# Contribution levels evaluated per optimization sweep
+CANDIDATE_CONTRIBUTIONS = 64
+
+# Adaptive sampling: a cheap pilot sweep over a subsample of the paths narrows
+# the contribution range to the candidates it cannot statistically separate
+# from the target (PILOT_Z standard errors), then the full set of paths
+# resolves that bracket on a fine grid
+PILOT_ITERATIONS = 500
+PILOT_Z = 3.0
+REFINED_CANDIDATES = 16
+
+# The final bisection narrows the answer to within this many rupees
+CONTRIBUTION_TOLERANCE = 0.01
+
+# Recommendation templates by outcome: target met, within 10 points of the
+# target, and short of it
+OPTIMIZATION_RECOMMENDATIONS = (
+    "Monthly contribution of ₹{contribution} gives you {probability:.1f}% probability of achieving ₹{pension} monthly pension.",
+    "Almost there! ₹{contribution}/month gives {probability:.1f}% probability. Small increase can reach your target.",
+    "Current strategy has {probability:.1f}% probability. Consider higher contribution or adjusting retirement expectations."
+)
+
+# Optimization results kept per inputs, iterations and seed; users
+# typically toggle one field at a time, so earlier answers recur often
+OPTIMIZATION_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=64)
+def _seeded_corpus_multipliers(
+    years: int,
+    risk_profile: str,
+    iterations: int,
+    seed: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Seeded (multiplier, growth) corpus factors for an investment horizon.
+    
+    Every optimizer probe and every repeat query with the same horizon and
+    profile prices contributions against these same return paths, so the
+    probability curve is deterministic and monotone in the contribution.
+    The factors are accumulated in float64 but kept in float32, which halves
+    the cache footprint and the memory traffic of every candidate sweep.
+    The arrays are read-only because they are shared between callers.
+    """
+    simulator = MonteCarloSimulator(iterations=iterations, seed=seed)
+    arrays = tuple(
+        arr.astype(np.float32)
+        for arr in simulator.corpus_multipliers(0, years, risk_profile)
+    )
+    for arr in arrays:
+        arr.setflags(write=False)
+    return arrays
+
+
+def _success_probabilities(
+    contributions,
+    multiplier: np.ndarray,
+    growth: np.ndarray,
+    initial_balance: float,
+    required_corpus: float
+) -> np.ndarray:
+    """Percentage of paths reaching the required corpus for each contribution."""
+    # Match the factors' precision so the (candidates, paths) corpus matrix
+    # is not promoted to float64
+    contributions = np.asarray(contributions, dtype=multiplier.dtype)
+    corpora = contributions[..., None] * multiplier + initial_balance * growth
+    return np.mean(corpora >= required_corpus, axis=-1) * 100
+
+
 class ContributionOptimizer:
     """
     Optimizer to find required monthly contribution for retirement goals.
     
-    Uses binary search with Monte Carlo validation to find contribution
-    amount that achieves target pension with desired probability.
+    Sweeps candidate contributions against one shared Monte Carlo return
+    draw to find the amount that achieves target pension with desired
+    probability.
     """
     
     def __init__(self, simulation_iterations: int = 5000):
@@ -46,8 +120,12 @@ class ContributionOptimizer:
         """
         Find monthly contribution required to achieve target pension.
         
-        Uses binary search to find contribution amount that achieves
-        target pension with specified probability threshold.
+        The contribution bounds are checked first, and the search range is
+        narrowed around the deterministic estimate when it brackets the
+        target. A pilot simulation sweeps a geometric grid of that range to
+        bracket the answer; the full simulation then sweeps that bracket in
+        one vectorized pass, locates the probability threshold on the
+        resulting curve and interpolates between the bracketing grid points.
         
         Args:
             current_age: Current age
@@ -59,71 +137,40 @@ class ContributionOptimizer:
             max_contribution: Maximum monthly contribution to test
         
         Returns:
-            Optimization results with required contribution
+            Optimization results with required contribution; memoized per
+            inputs, iterations and seed
         """
+        if retirement_age <= current_age:
+            raise ValueError("Retirement age must be greater than current age")
+        
+        # The search prices against seeded return draws, so the result is a
+        # pure function of the inputs and the simulator configuration
+        return dict(_optimize_cached(
+            current_age,
+            retirement_age,
+            target_monthly_pension,
+            risk_profile,
+            target_probability,
+            initial_balance,
+            max_contribution,
+            self.simulator.iterations,
+            self.simulator.seed
+        ))
+    
+    def _optimize(
+        self,
+        current_age: int,
+        retirement_age: int,
+        target_monthly_pension: float,
+        risk_profile: str,
+        target_probability: float,
+        initial_balance: float,
+        max_contribution: float
+    ) -> Dict:
+        """Uncached body of find_required_contribution."""
         # Convert target pension to required corpus
         required_corpus = self._pension_to_corpus(target_monthly_pension)
         
-        # Binary search bounds
-        min_contribution = NPS_MIN_CONTRIBUTION_MONTHLY
-        max_contribution = max_contribution
-        
-        # Binary search parameters
-        tolerance = 100  # INR tolerance
-        max_iterations = 20
-        best_contribution = None
-        best_probability = 0
-        
-        for iteration in range(max_iterations):
-            # Test midpoint
-            test_contribution = (min_contribution + max_contribution) / 2
-            
-            # Run simulation with this contribution
-            result = self.simulator.calculate_goal_probability(
-                current_age,
-                retirement_age,
-                test_contribution,
-                target_monthly_pension,
-                risk_profile,
-                initial_balance
-            )
-            
-            probability = result["probability_of_success"]
-            
-            # Track best result
-            if probability >= target_probability and (
-                best_contribution is None or test_contribution < best_contribution
-            ):
-                best_contribution = test_contribution
-                best_probability = probability
-            
-            # Check if we've found good enough solution
-            if abs(probability - target_probability) < 2:  # Within 2% of target
-                break
-            
-            # Adjust search bounds
-            if probability < target_probability:
-                min_contribution = test_contribution
-            else:
-                max_contribution = test_contribution
-            
-            # Check if bounds are too close
-            if max_contribution - min_contribution < tolerance:
-                break
-        
-        # If no solution found within bounds, return max tested
-        if best_contribution is None:
-            best_contribution = max_contribution
-            result = self.simulator.calculate_goal_probability(
-                current_age,
-                retirement_age,
-                best_contribution,
-                target_monthly_pension,
-                risk_profile,
-                initial_balance
-            )
-            best_probability = result["probability_of_success"]
-        
         # Calculate what deterministic calculation would suggest
         deterministic_contribution = self._deterministic_required_contribution(
             current_age,
@@ -133,6 +180,17 @@ class ContributionOptimizer:
             initial_balance
         )
         
+        best_contribution, best_probability = self._search_contribution(
+            current_age,
+            retirement_age,
+            risk_profile,
+            initial_balance,
+            required_corpus,
+            target_probability,
+            max_contribution,
+            deterministic_contribution
+        )
+        
         return {
             "required_monthly_contribution": round(best_contribution, 2),
             "achieved_probability": round(best_probability, 2),
@@ -150,6 +208,122 @@ class ContributionOptimizer:
             )
         }
     
+    def _search_contribution(
+        self,
+        current_age: int,
+        retirement_age: int,
+        risk_profile: str,
+        initial_balance: float,
+        required_corpus: float,
+        target_probability: float,
+        max_contribution: float,
+        deterministic_contribution: float
+    ) -> Tuple[float, float]:
+        """
+        Find the smallest contribution meeting the target probability.
+        
+        The answer is exact to CONTRIBUTION_TOLERANCE on the seeded success
+        curve.
+        
+        Returns:
+            (contribution, probability of success in percent); the maximum
+            contribution and its probability if even that falls short
+        """
+        # Each path's final corpus is linear in the contribution, so one
+        # return draw prices every candidate contribution at once
+        multiplier, growth = _seeded_corpus_multipliers(
+            retirement_age - current_age,
+            risk_profile,
+            self.simulator.iterations,
+            self.simulator.seed
+        )
+        
+        # The contribution bounds and the range around the deterministic
+        # estimate are priced together in one sweep
+        low_contribution, high_contribution = NPS_MIN_CONTRIBUTION_MONTHLY, max_contribution
+        probes = np.clip(
+            [
+                low_contribution, high_contribution,
+                0.5 * deterministic_contribution, 2 * deterministic_contribution
+            ],
+            low_contribution, high_contribution
+        )
+        low_prob, high_prob, *seeded_prob = _success_probabilities(
+            probes, multiplier, growth, initial_balance, required_corpus
+        )
+        
+        # Many requests resolve at a bound: a modest target is already met at
+        # the minimum, an ambitious one is out of reach even at the maximum
+        if low_prob >= target_probability:
+            return float(low_contribution), float(low_prob)
+        if high_prob < target_probability:
+            return float(high_contribution), float(high_prob)
+        
+        # Narrow the range to around the deterministic estimate when that
+        # still brackets the target
+        if deterministic_contribution > 0 and (
+            seeded_prob[0] < target_probability <= seeded_prob[1]
+        ):
+            low_contribution, high_contribution = probes[2:]
+        
+        candidates = np.geomspace(
+            low_contribution, high_contribution, CANDIDATE_CONTRIBUTIONS
+        )
+        
+        # A small pilot subsample brackets the answer: only candidates whose
+        # pilot probability is within PILOT_Z standard errors of the target need
+        # the full-precision sweep, which then resolves that bracket finely
+        pilot_multiplier = multiplier[:PILOT_ITERATIONS]
+        pilot_growth = growth[:PILOT_ITERATIONS]
+        pilot_probabilities = _success_probabilities(
+            candidates, pilot_multiplier, pilot_growth, initial_balance, required_corpus
+        )
+        target_fraction = target_probability / 100
+        margin = PILOT_Z * 100 * np.sqrt(
+            target_fraction * (1 - target_fraction) / PILOT_ITERATIONS
+        )
+        low = max(int(np.searchsorted(pilot_probabilities, target_probability - margin)) - 1, 0)
+        high = min(
+            int(np.searchsorted(pilot_probabilities, target_probability + margin)),
+            len(candidates) - 1
+        )
+        
+        bracket = np.geomspace(candidates[low], candidates[high], REFINED_CANDIDATES)
+        probabilities = _success_probabilities(
+            bracket, multiplier, growth, initial_balance, required_corpus
+        )
+        if (low > 0 and probabilities[0] >= target_probability) or (
+            high < len(candidates) - 1 and probabilities[-1] < target_probability
+        ):
+            # The pilot misjudged the bracket; sweep the full range instead
+            bracket = candidates
+            probabilities = _success_probabilities(
+                bracket, multiplier, growth, initial_balance, required_corpus
+            )
+        candidates = bracket
+        
+        # Probability rises with the contribution, so the curve is sorted and
+        # the first candidate meeting the target is found by binary search
+        best = int(np.searchsorted(probabilities, target_probability))
+        best_contribution = float(candidates[best])
+        best_probability = float(probabilities[best])
+        
+        if best > 0:
+            # Bisect the success curve between the last failing and first
+            # passing candidates, which are a whole grid step apart
+            low_contribution = float(candidates[best - 1])
+            while best_contribution - low_contribution > CONTRIBUTION_TOLERANCE:
+                contribution = (low_contribution + best_contribution) / 2
+                probability = float(_success_probabilities(
+                    contribution, multiplier, growth, initial_balance, required_corpus
+                ))
+                if probability >= target_probability:
+                    best_contribution, best_probability = contribution, probability
+                else:
+                    low_contribution = contribution
+        
+        return best_contribution, best_probability
+    
     def compare_contribution_levels(
         self,
         current_age: int,
@@ -169,71 +343,89 @@ class ContributionOptimizer:
             initial_balance: Current balance
         
         Returns:
-            Comparison results for each contribution level
+            Comparison results as parallel lists, one entry per contribution
+            level, so callers can rank or search the levels without a loop
+            (e.g. np.searchsorted on "percentile_10_pension") and the result
+            serializes to JSON as is
         """
-        results = {}
-        
-        for contribution in contribution_amounts:
-            sim_result = self.simulator.simulate_retirement_corpus(
-                current_age,
-                retirement_age,
-                contribution,
-                risk_profile,
-                initial_balance
-            )
-            
-            results[f"contribution_{int(contribution)}"] = {
-                "monthly_contribution": contribution,
-                "median_corpus": sim_result["corpus_statistics"]["median"],
-                "median_pension": sim_result["pension_statistics"]["median_pension"],
-                "percentile_10_pension": sim_result["pension_statistics"]["percentile_10"],
-                "percentile_90_pension": sim_result["pension_statistics"]["percentile_90"]
-            }
-        
-        return results
+        # One return draw serves every level; only the linear scale differs
+        multiplier, growth = self.simulator.corpus_multipliers(
+            current_age, retirement_age, risk_profile
+        )
+        
+        contributions = np.asarray(contribution_amounts, dtype=float)
+        corpora = np.maximum(
+            contributions[:, None] * multiplier + initial_balance * growth, 0
+        )
+        
+        # The pension is a fixed multiple of the corpus, so its percentiles
+        # are the corpus percentiles converted, from one sort per level
+        corpus_p10, median_corpus, corpus_p90 = percentiles(corpora, [10, 50, 90], axis=1)
+        (pension_p10, pension_p50, pension_p90), _ = estimate_monthly_pension(
+            np.stack([corpus_p10, median_corpus, corpus_p90])
+        )
+        
+        return {
+            "monthly_contributions": contributions.tolist(),
+            "median_corpus": np.round(median_corpus, 2).tolist(),
+            "median_pension": np.round(pension_p50, 2).tolist(),
+            "percentile_10_pension": np.round(pension_p10, 2).tolist(),
+            "percentile_90_pension": np.round(pension_p90, 2).tolist()
+        }
     
-    def _pension_to_corpus(self, monthly_pension: float) -> float:
-        """Convert target monthly pension to required corpus amount."""
+    def _pension_to_corpus(self, monthly_pension):
+        """
+        Convert target monthly pension to required corpus amount.
+        
+        Accepts a scalar or an array of pensions.
+        """
         # pension = corpus * 0.4 * annuity_rate / 12
         # corpus = (pension * 12) / (0.4 * annuity_rate)
-        required_corpus = (monthly_pension * 12) / (0.4 * ANNUITY_RATE_SINGLE_LIFE / 100)
-        return required_corpus
+        required_corpus = (np.asarray(monthly_pension) * 12) / (0.4 * ANNUITY_RATE_SINGLE_LIFE / 100)
+        return required_corpus if required_corpus.ndim else float(required_corpus)
     
     def _deterministic_required_contribution(
         self,
-        current_age: int,
-        retirement_age: int,
-        target_corpus: float,
+        current_age,
+        retirement_age,
+        target_corpus,
         risk_profile: str,
-        initial_balance: float
-    ) -> float:
+        initial_balance
+    ):
         """
         Calculate required contribution using deterministic formula.
         
         This provides a baseline estimate without Monte Carlo simulation.
+        Ages, target corpus and initial balance may be arrays, which are
+        broadcast together to evaluate a grid of goals in one call.
         """
-        years = retirement_age - current_age
+        years = np.subtract(retirement_age, current_age)
         months = years * 12
         
         mean_return = EXPECTED_RETURNS[risk_profile]["mean"]
         monthly_rate = mean_return / 100 / 12
         
-        # Account for initial balance future value
-        fv_initial = initial_balance * ((1 + monthly_rate) ** months)
-        remaining_target = target_corpus - fv_initial
+        # (1 + r)^n - 1 in log space; exact even when r * n is small
+        compound_growth = np.expm1(months * np.log1p(monthly_rate))
         
-        if remaining_target <= 0:
-            return 0  # Initial balance is enough
+        # Account for initial balance future value
+        fv_initial = np.multiply(initial_balance, 1 + compound_growth)
+        remaining_target = np.subtract(target_corpus, fv_initial)
         
-        # Calculate required monthly contribution
+        # Calculate required monthly contribution (annuity due)
         if monthly_rate > 0:
-            required_contribution = remaining_target / (
-                ((1 + monthly_rate) ** months - 1) / monthly_rate * (1 + monthly_rate)
+            required_contribution = remaining_target * monthly_rate / (
+                compound_growth * (1 + monthly_rate)
             )
         else:
             required_contribution = remaining_target / months
         
-        return max(required_contribution, NPS_MIN_CONTRIBUTION_MONTHLY)
+        required_contribution = np.where(
+            remaining_target <= 0,
+            0.0,  # Initial balance is enough
+            np.maximum(required_contribution, NPS_MIN_CONTRIBUTION_MONTHLY)
+        )
+        return required_contribution if required_contribution.ndim else float(required_contribution)
     
     def _generate_optimization_recommendation(
         self,
@@ -244,9 +436,39 @@ class ContributionOptimizer:
     ) -> str:
         """Generate recommendation based on optimization results."""
         if probability >= target_prob:
-            return f"Monthly contribution of ₹{int(contribution)} gives you {probability:.1f}% probability of achieving ₹{int(pension)} monthly pension."
+            bucket = 0
         elif probability >= (target_prob - 10):
-            return f"Almost there! ₹{int(contribution)}/month gives {probability:.1f}% probability. Small increase can reach your target."
+            bucket = 1
         else:
-            shortfall_pct = target_prob - probability
-            return f"Current strategy has {probability:.1f}% probability. Consider higher contribution or adjusting retirement expectations."
+            bucket = 2
+        return OPTIMIZATION_RECOMMENDATIONS[bucket].format(
+            contribution=int(contribution),
+            probability=probability,
+            pension=int(pension)
+        )
+
+
+@lru_cache(maxsize=OPTIMIZATION_CACHE_SIZE)
+def _optimize_cached(
+    current_age: int,
+    retirement_age: int,
+    target_monthly_pension: float,
+    risk_profile: str,
+    target_probability: float,
+    initial_balance: float,
+    max_contribution: float,
+    iterations: int,
+    seed: int
+) -> Dict:
+    """Optimization result for a simulator configuration; deterministic per inputs."""
+    optimizer = ContributionOptimizer(simulation_iterations=iterations)
+    optimizer.simulator = MonteCarloSimulator(iterations=iterations, seed=seed)
+    return optimizer._optimize(
+        current_age,
+        retirement_age,
+        target_monthly_pension,
+        risk_profile,
+        target_probability,
+        initial_balance,
+        max_contribution
+    )
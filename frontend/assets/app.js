@@ -221,9 +221,8 @@ function displayResults(api, fd) {
     animateKPI('pensionValue', medPension);
     animateKPI('realCorpusValue', det.real_corpus);
 
-    if (sim && sim.all_outcomes) {
-        const rate = successRate(sim.all_outcomes, medCorpus);
-        setText('probabilityValue', rate + '%');
+    if (sim) {
+        setText('probabilityValue', sim.success_rate + '%');
         setText('corpusSubtext',
             `10th–90th: ${formatINR(sim.corpus_statistics.percentile_10)} — ${formatINR(sim.corpus_statistics.percentile_90)}`);
     } else {
@@ -808,11 +807,6 @@ function showToast(msg) {
     setTimeout(() => toast.remove(), 3000);
 }
 
-function successRate(outcomes, target) {
-    if (!outcomes || !outcomes.length) return 0;
-    return Math.round((outcomes.filter(v => v >= target * 0.9).length / outcomes.length) * 100);
-}
-
 function applySmartDefaults(age) {
     age = parseInt(age);
     const contrib = document.getElementById('monthlyContribution');
@@ -11,7 +11,12 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from backend.engine.corpus_calculator import calculate_retirement_projection, compare_scenarios
+from backend.engine.corpus_calculator import (
+    calculate_retirement_projection,
+    calculate_projection_batch,
+    compare_scenarios,
+    project_for_contributions
+)
 from backend.engine.monte_carlo import MonteCarloSimulator
 from backend.engine.optimizer import ContributionOptimizer
 
@@ -83,7 +88,8 @@ def test_monte_carlo_simulation():
     # Sanity checks
     assert result['corpus_statistics']['median'] > 0, "Median corpus should be positive"
     assert result['corpus_statistics']['percentile_90'] > result['corpus_statistics']['percentile_10'], "90th > 10th"
-    assert len(result['all_outcomes']) == 1000, "Should have 1000 outcomes"
+    assert 'all_outcomes' not in result, "Raw outcomes should be opt-in"
+    assert 0 <= result['success_rate'] <= 100, "Success rate should be a percentage"
     
     print("\n✓ Test PASSED")
 
@@ -142,7 +148,38 @@ def test_contribution_optimizer():
     
     # Sanity check
     assert result['required_monthly_contribution'] >= 500, "Should be >= minimum contribution"
-    assert result['achieved_probability'] > 0, "Should have some probability"
+    assert result['achieved_probability'] >= result['target_probability'], "Seeded search should meet the target"
+    
+    print("\n✓ Test PASSED")
+
+
+def test_projection_batch():
+    """Test batched projection against single projections"""
+    print_separator("Test 5: Batched Projection")
+    
+    scenarios = [
+        {"current_age": 30, "retirement_age": 60, "monthly_contribution": 5000},
+        {"current_age": 25, "retirement_age": 65, "monthly_contribution": 7500,
+         "risk_profile": "aggressive", "initial_balance": 100000,
+         "annual_step_up": 8.0, "employer_contribution": 2000},
+        {"current_age": 45, "retirement_age": 58, "monthly_contribution": 12000,
+         "risk_profile": "conservative", "annuity_provider": "SBI"}
+    ]
+    
+    results = calculate_projection_batch(scenarios)
+    
+    for scenario, result in zip(scenarios, results):
+        single = calculate_retirement_projection(**scenario)
+        print(f"Age {scenario['current_age']}→{scenario['retirement_age']}  "
+              f"Batch: ₹{result['nominal_corpus']:>14,.2f}  Single: ₹{single['nominal_corpus']:>14,.2f}")
+        
+        assert abs(result['nominal_corpus'] - single['nominal_corpus']) <= 0.05, "Batch corpus should match single projection"
+        assert abs(result['real_corpus'] - single['real_corpus']) <= 0.05, "Batch real corpus should match single projection"
+        assert abs(result['monthly_pension_nominal'] - single['monthly_pension_nominal']) <= 0.05, "Batch pension should match"
+    
+    corpora = project_for_contributions([2000, 5000, 8000], current_age=30, retirement_age=60)
+    assert abs(corpora[1] - results[0]['nominal_corpus']) <= 0.05, "Contribution sweep should match projection"
+    assert corpora[0] < corpora[1] < corpora[2], "Corpus should grow with contribution"
     
     print("\n✓ Test PASSED")
 
@@ -157,6 +194,7 @@ def run_all_tests():
         test_monte_carlo_simulation()
         test_scenario_comparison()
         test_contribution_optimizer()
+        test_projection_batch()
         
         print_separator("All Tests PASSED ✓")
         print("\nCore engine is working correctly!")